@@ -11,3 +11,9 @@ class AccountsConfig(AppConfig):
     """
     default_auto_field = "django.db.models.BigAutoField"  # Default primary key field type
     name = "accounts"  # App name
+
+    def ready(self):
+        """
+        Connects the signal receivers that keep cached user principals fresh.
+        """
+        from . import signals  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
@@ -0,0 +1,55 @@
+"""
+This module contains the REST framework authentication class used by the API.
+It resolves JWTs to a cached user principal so that authenticated requests do
+not need to load the User row (and its Spotify link) from the database. See
+`accounts.principals` for when principals are cached and how they are invalidated.
+"""
+# pylint: disable=E1101
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import SpotifyToken
+from .principals import PRINCIPAL_FIELDS, principal_cache_enabled, principal_key, version_key
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches a minimal principal per user and token version
+    for `AUTH_PRINCIPAL_CACHE_TTL` seconds. When `principal_cache_enabled` is
+    False, it behaves like `JWTAuthentication` and returns the database user.
+
+    The principal is an unsaved `User` instance carrying only `PRINCIPAL_FIELDS`
+    plus a `spotify_linked` flag. It can be used in queries and for `delete()`,
+    but must never be saved, since its password and other fields are not loaded.
+    """
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken("Token contained no recognizable user identification") from exc
+
+        if not principal_cache_enabled():
+            return super().get_user(validated_token)
+
+        key = principal_key(user_id, cache.get(version_key(user_id), 0))
+        principal = cache.get(key)
+        if principal is None:
+            user = super().get_user(validated_token)
+            principal = {field: getattr(user, field) for field in PRINCIPAL_FIELDS}
+            principal["spotify_linked"] = SpotifyToken.objects.filter(user=user).exists()
+            principal["password_hash"] = get_md5_hash_password(user.password)
+            cache.set(key, principal, settings.AUTH_PRINCIPAL_CACHE_TTL)
+        elif api_settings.CHECK_REVOKE_TOKEN and (
+            validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != principal["password_hash"]
+        ):
+            raise AuthenticationFailed("The user's password has been changed.", code="password_changed")
+
+        user = User(id=user_id, **{field: principal[field] for field in PRINCIPAL_FIELDS})
+        user._state.adding = False  # pylint: disable=protected-access
+        user.spotify_linked = principal["spotify_linked"]
+        return user
@@ -0,0 +1,39 @@
+"""
+This module contains the authentication backend used for username/password logins.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+
+from .hashing import hash_password, verify_password
+
+UserModel = get_user_model()
+
+
+class BoundedHashingModelBackend(ModelBackend):
+    """
+    `ModelBackend` that checks passwords on the bounded hashing pool. It is used by
+    `authenticate()`, so it covers both the JWT login endpoint and `LoginView`.
+    """
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)  # pylint: disable=protected-access
+        except UserModel.DoesNotExist:
+            # Hash anyway so that unknown usernames take as long as wrong passwords
+            hash_password(password)
+            return None
+
+        if not verify_password(password, user.password) or not self.user_can_authenticate(user):
+            return None
+
+        # Re-hash passwords stored with an outdated hasher or iteration count
+        preferred = get_hasher()
+        if identify_hasher(user.password).algorithm != preferred.algorithm or preferred.must_update(user.password):
+            user.password = hash_password(password)
+            user.save(update_fields=["password"])
+        return user
@@ -0,0 +1,47 @@
+"""
+This module contains `RequestCoalescer`, which lets concurrent identical requests
+share the work of a single execution instead of each repeating it.
+"""
+import threading
+from concurrent.futures import Future
+
+
+class RequestCoalescer:
+    """
+    Runs at most one call per key at a time within this process. Callers that
+    arrive while a call for their key is in flight wait for it and receive the
+    same result, or the same exception. Results are not kept after the call ends.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def run(self, key, func):
+        """
+        Calls `func`, or waits for the in-flight call with the same key.
+
+        Args:
+            key (hashable): Identifies identical requests.
+            func (callable): Zero-argument function doing the work.
+
+        Returns:
+            The return value of `func`, shared by every caller for the key.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        future.set_result(result)
+        return result
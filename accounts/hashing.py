@@ -0,0 +1,118 @@
+"""
+This module runs password hashing on a bounded thread pool so that a burst of
+sign-ups or logins cannot occupy every worker thread with PBKDF2 rounds. When
+all hashing slots are taken, callers get an immediate HTTP 429 instead of
+queueing behind the burst. Sign-ups may only hold part of the slots, so logins
+keep getting through during a sign-up storm.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+_lock = threading.Lock()
+_pool = {"config": None, "executor": None, "slots": None, "signup_slots": None}
+
+
+class HashingCapacityExceeded(APIException):
+    """
+    Raised when the password hashing pool and its queue are full.
+    """
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    default_detail = "Too many sign-in requests right now. Please try again shortly."
+    default_code = "hashing_capacity_exceeded"
+
+
+def _get_pool():
+    """
+    Returns the pool, rebuilding it if the PASSWORD_HASHING_* settings changed.
+    """
+    config = (
+        settings.PASSWORD_HASHING_WORKERS,
+        settings.PASSWORD_HASHING_QUEUE_SIZE,
+        settings.PASSWORD_HASHING_SIGNUP_SLOTS,
+    )
+    with _lock:
+        if _pool["config"] != config:
+            if _pool["executor"] is not None:
+                _pool["executor"].shutdown(wait=False)
+            workers, queue_size, signup_slots = config
+            _pool["config"] = config
+            _pool["executor"] = None
+            if workers:
+                total_slots = workers + queue_size
+                _pool["executor"] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hashing")
+                _pool["slots"] = threading.BoundedSemaphore(total_slots)
+                _pool["signup_slots"] = threading.BoundedSemaphore(min(signup_slots or total_slots // 2 or 1, total_slots))
+        return dict(_pool)
+
+
+def run_hashing(func, *args, signup=False):
+    """
+    Runs a hashing function on the bounded pool and waits for its result. Hashing
+    runs inline when PASSWORD_HASHING_WORKERS is 0.
+
+    Args:
+        func (callable): The CPU-bound hashing function.
+        *args: Arguments passed to `func`.
+        signup (bool): Count the call against the sign-up share of the slots.
+
+    Returns:
+        The return value of `func`.
+
+    Raises:
+        HashingCapacityExceeded: If every worker is busy and the queue is full.
+    """
+    pool = _get_pool()
+    if pool["executor"] is None:
+        return func(*args)
+
+    held = [pool["signup_slots"], pool["slots"]] if signup else [pool["slots"]]
+    for index, slots in enumerate(held):
+        if not slots.acquire(blocking=False):
+            for acquired in held[:index]:
+                acquired.release()
+            raise HashingCapacityExceeded()
+
+    def release(_):
+        for slots in held:
+            slots.release()
+
+    try:
+        future = pool["executor"].submit(func, *args)
+    except RuntimeError:
+        release(None)
+        raise
+    future.add_done_callback(release)
+    return future.result()
+
+
+def hash_password(raw_password, signup=False):
+    """
+    Hashes a password with the default hasher on the bounded pool.
+
+    Args:
+        raw_password (str): The plain-text password.
+        signup (bool): Count the call against the sign-up share of the slots.
+
+    Returns:
+        str: The encoded password hash.
+    """
+    return run_hashing(make_password, raw_password, signup=signup)
+
+
+def verify_password(raw_password, encoded):
+    """
+    Checks a password against an encoded hash on the bounded pool.
+
+    Args:
+        raw_password (str): The plain-text password.
+        encoded (str): The stored password hash.
+
+    Returns:
+        bool: True if the password matches.
+    """
+    return run_hashing(check_password, raw_password, encoded)
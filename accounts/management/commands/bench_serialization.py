@@ -0,0 +1,126 @@
+"""
+Management command that compares renderer speed and payload size on realistic
+wrap and wrapped history responses.
+"""
+import random
+import string
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from accounts import renderers
+
+
+def _spotify_id(rng):
+    return "".join(rng.choices(string.ascii_letters + string.digits, k=22))
+
+
+def _image_url(rng):
+    return f"https://i.scdn.co/image/ab6761610000e5eb{rng.getrandbits(96):024x}"
+
+
+def build_wrap(rng, artist_count, track_count):
+    """
+    Builds a payload shaped like a SpotifyWrappedDataView response.
+
+    Args:
+        rng (random.Random): Seeded random generator.
+        artist_count (int): Number of top artists.
+        track_count (int): Number of top tracks.
+
+    Returns:
+        dict: The wrap payload.
+    """
+    artists = [
+        {
+            "id": _spotify_id(rng),
+            "name": f"Artist {index}",
+            "genres": rng.sample(["indie pop", "alt z", "bedroom pop", "modern rock", "k-pop", "hip hop"], 3),
+            "image": _image_url(rng),
+            "popularity": rng.randint(20, 100),
+        }
+        for index in range(artist_count)
+    ]
+    tracks = [
+        {
+            "id": _spotify_id(rng),
+            "name": f"Track {index} (feat. Someone)",
+            "album": f"Album {index % 40}",
+            "album_image": _image_url(rng),
+            "artists": [{"id": artist["id"], "name": artist["name"]} for artist in rng.sample(artists, 2)],
+            "preview_url": f"https://p.scdn.co/mp3-preview/{rng.getrandbits(160):040x}",
+            "popularity": rng.randint(20, 100),
+        }
+        for index in range(track_count)
+    ]
+    return {"artists": artists, "tracks": tracks}
+
+
+def build_history(rng, wrap_count, artist_count):
+    """
+    Builds a payload shaped like a WrappedHistoryView response.
+
+    Args:
+        rng (random.Random): Seeded random generator.
+        wrap_count (int): Number of wraps in the history.
+        artist_count (int): Number of artists per wrap.
+
+    Returns:
+        list: The history payload.
+    """
+    return [
+        {
+            "id": wrap_id,
+            "title": "Short-Term Wrapped",
+            "image": _image_url(rng),
+            "artists": [
+                {
+                    "name": f"Artist {index}",
+                    "images": [{"url": _image_url(rng)}],
+                    "top_song": f"Track {index}",
+                    "description": "indie pop, alt z, bedroom pop",
+                    "song_preview": f"https://open.spotify.com/track/{_spotify_id(rng)}",
+                }
+                for index in range(artist_count)
+            ],
+        }
+        for wrap_id in range(wrap_count)
+    ]
+
+
+class Command(BaseCommand):
+    """
+    Renders the same wrap and history payloads with each available renderer and
+    prints the mean render time and the encoded size.
+    """
+    help = "Benchmark wrap payload serialization time and size per renderer."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--artists", type=int, default=50, help="Artists per wrap.")
+        parser.add_argument("--tracks", type=int, default=200, help="Tracks per wrap.")
+        parser.add_argument("--history-wraps", type=int, default=20, help="Wraps in the history payload.")
+        parser.add_argument("--iterations", type=int, default=200, help="Renders per measurement.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(2340)
+        payloads = {
+            "wrap": build_wrap(rng, options["artists"], options["tracks"]),
+            "history": build_history(rng, options["history_wraps"], options["artists"]),
+        }
+
+        candidates = [("JSONRenderer", JSONRenderer())]
+        if renderers.orjson is not None:
+            candidates.append(("ORJSONRenderer", renderers.ORJSONRenderer()))
+        if renderers.msgpack is not None:
+            candidates.append(("MsgPackRenderer", renderers.MsgPackRenderer()))
+
+        self.stdout.write(f"{'payload':<8} {'renderer':<16} {'time/render':>12} {'size':>10}")
+        for payload_name, payload in payloads.items():
+            for renderer_name, renderer in candidates:
+                renderer.render(payload, renderer.media_type, {})
+                start = time.perf_counter()
+                for _ in range(options["iterations"]):
+                    body = renderer.render(payload, renderer.media_type, {})
+                elapsed_us = (time.perf_counter() - start) / options["iterations"] * 1_000_000
+                self.stdout.write(f"{payload_name:<8} {renderer_name:<16} {elapsed_us:>10.1f}us {len(body):>9,}B")
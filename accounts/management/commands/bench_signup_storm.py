@@ -0,0 +1,113 @@
+"""
+Management command that benchmarks password hashing under a sign-up storm,
+comparing inline hashing with the bounded hashing pool.
+"""
+import statistics
+import threading
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.hashing import HashingCapacityExceeded, hash_password, verify_password
+from accounts.views import ProtectedView
+
+
+class Command(BaseCommand):
+    """
+    Runs sign-up threads that hash passwords, login threads that verify them, and
+    a probe that calls a cheap endpoint, first with inline hashing and then with the
+    bounded pool. Reports sign-ups and logins per second, 429 rejections, and the
+    probe's latency percentiles. No database access is needed.
+    """
+    help = "Benchmark login throughput and cheap-endpoint latency during a sign-up storm."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--duration", type=float, default=5.0, help="Seconds per run.")
+        parser.add_argument("--signup-threads", type=int, default=16, help="Concurrent sign-up clients.")
+        parser.add_argument("--login-threads", type=int, default=2, help="Concurrent login clients.")
+        parser.add_argument("--workers", type=int, default=2, help="Hashing pool size for the bounded run.")
+        parser.add_argument("--queue-size", type=int, default=4, help="Hashing queue size for the bounded run.")
+
+    def handle(self, *args, **options):
+        runs = [
+            ("inline", 0, 0),
+            ("bounded", options["workers"], options["queue_size"]),
+        ]
+        self.stdout.write(f"{'mode':<8} {'signups/s':>10} {'logins/s':>9} {'429s':>6} {'probe p50':>10} {'p95':>8} {'p99':>8}")
+        for name, workers, queue_size in runs:
+            with override_settings(
+                PASSWORD_HASHING_WORKERS=workers,
+                PASSWORD_HASHING_QUEUE_SIZE=queue_size,
+                PASSWORD_HASHING_SIGNUP_SLOTS=0,
+            ):
+                result = self.run_storm(options)
+            self.stdout.write(
+                f"{name:<8} {result['signups'] / options['duration']:>10.1f} "
+                f"{result['logins'] / options['duration']:>9.1f} {result['rejected']:>6} "
+                f"{result['p50']:>8.1f}ms {result['p95']:>6.1f}ms {result['p99']:>6.1f}ms"
+            )
+
+    def run_storm(self, options):
+        """
+        Runs one storm with the current hashing settings.
+
+        Args:
+            options (dict): The parsed command options.
+
+        Returns:
+            dict: Counters and probe latency percentiles in milliseconds.
+        """
+        deadline = time.perf_counter() + options["duration"]
+        encoded = make_password("correct horse battery staple")
+        counts = {"signups": 0, "logins": 0, "rejected": 0}
+        counts_lock = threading.Lock()
+        latencies = []
+
+        def count(key):
+            with counts_lock:
+                counts[key] += 1
+
+        def signup():
+            while time.perf_counter() < deadline:
+                try:
+                    hash_password("correct horse battery staple", signup=True)
+                    count("signups")
+                except HashingCapacityExceeded:
+                    count("rejected")
+                    time.sleep(0.01)
+
+        def login():
+            while time.perf_counter() < deadline:
+                try:
+                    verify_password("correct horse battery staple", encoded)
+                    count("logins")
+                except HashingCapacityExceeded:
+                    count("rejected")
+                    time.sleep(0.01)
+
+        def probe():
+            factory = APIRequestFactory()
+            view = ProtectedView.as_view()
+            user = User(id=1, username="probe")
+            while time.perf_counter() < deadline:
+                request = factory.get("/api/protected/")
+                force_authenticate(request, user=user)
+                start = time.perf_counter()
+                view(request).render()
+                latencies.append((time.perf_counter() - start) * 1000)
+                time.sleep(0.01)
+
+        threads = [threading.Thread(target=signup) for _ in range(options["signup_threads"])]
+        threads += [threading.Thread(target=login) for _ in range(options["login_threads"])]
+        threads.append(threading.Thread(target=probe))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+        return {**counts, "p50": quantiles[49], "p95": quantiles[94], "p99": quantiles[98]}
@@ -0,0 +1,88 @@
+"""
+Management command that measures cold-start cost: the `-X importtime` profile of
+loading the project and its views, and the time from process start to the first
+response served by the WSGI application.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+IMPORT_SCRIPT = """
+import django
+django.setup()
+import accounts.views
+"""
+
+FIRST_RESPONSE_SCRIPT = """
+import io
+import sys
+from spotify_wrapped.wsgi import application
+
+environ = {
+    "REQUEST_METHOD": "GET",
+    "PATH_INFO": sys.argv[1],
+    "QUERY_STRING": "",
+    "SERVER_NAME": "localhost",
+    "SERVER_PORT": "80",
+    "HTTP_HOST": "localhost",
+    "wsgi.input": io.BytesIO(),
+    "wsgi.errors": sys.stderr,
+    "wsgi.url_scheme": "http",
+}
+statuses = []
+b"".join(application(environ, lambda status, headers, exc_info=None: statuses.append(status)))
+print(statuses[0])
+"""
+
+
+class Command(BaseCommand):
+    """
+    Runs each measurement in fresh interpreters so that nothing is already imported,
+    and prints the slowest imports by cumulative time along with the median
+    time-to-first-response.
+    """
+    help = "Benchmark import time and time-to-first-response of a cold process."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="Cold starts to time.")
+        parser.add_argument("--top", type=int, default=15, help="Slowest imports to list.")
+        parser.add_argument("--path", default="/api/spotify/auth-url/", help="URL path of the first request.")
+
+    def handle(self, *args, **options):
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "spotify_wrapped.settings")}
+        cwd = str(settings.BASE_DIR)
+
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+            env=env, cwd=cwd, capture_output=True, text=True, check=True,
+        )
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            imports.append((int(cumulative_us), int(self_us), name.strip()))
+        total_us = sum(self_us for _, self_us, _ in imports)
+
+        self.stdout.write(f"Total import time: {total_us / 1000:.1f}ms across {len(imports)} modules")
+        self.stdout.write(f"{'cumulative':>12} {'self':>10}  module")
+        for cumulative_us, self_us, name in sorted(imports, reverse=True)[:options["top"]]:
+            self.stdout.write(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name}")
+
+        timings = []
+        for _ in range(options["runs"]):
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-c", FIRST_RESPONSE_SCRIPT, options["path"]],
+                env=env, cwd=cwd, capture_output=True, text=True, check=True,
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+        self.stdout.write(
+            f"Time to first response ({options['path']} -> {result.stdout.strip()}): "
+            f"median {statistics.median(timings):.1f}ms, min {min(timings):.1f}ms over {options['runs']} runs"
+        )
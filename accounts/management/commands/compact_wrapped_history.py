@@ -0,0 +1,94 @@
+"""
+Management command that collapses duplicate Spotify wraps and applies the
+configured per-term retention to existing WrappedHistory rows.
+"""
+# pylint: disable=E1101
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.models import WrappedHistory
+
+
+class Command(BaseCommand):
+    """
+    Backfills the term and content hash of older wraps, deletes every wrap that is
+    identical to the wrap saved just before it for the same user and term, and then
+    keeps only the newest `--keep` wraps per user and term.
+    """
+    help = "Collapse duplicate wraps and enforce the wrapped history retention policy."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=settings.WRAPPED_HISTORY_RETENTION,
+            help="Wraps to keep per user and term (0 keeps all). Defaults to WRAPPED_HISTORY_RETENTION.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be deleted without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        keep = options["keep"]
+        dry_run = options["dry_run"]
+
+        backfilled = self.backfill(dry_run)
+
+        duplicate_ids = []
+        remaining = {}
+        previous = {}
+        wraps = WrappedHistory.objects.order_by("created_at", "id").values_list("id", "user_id", "term", "content_hash")
+        for wrap_id, user_id, term, content_hash in wraps.iterator():
+            term, content_hash = backfilled.get(wrap_id, (term, content_hash))
+            group = (user_id, term)
+            if previous.get(group) == content_hash:
+                duplicate_ids.append(wrap_id)
+            else:
+                previous[group] = content_hash
+                remaining[group] = remaining.get(group, 0) + 1
+
+        if dry_run:
+            prunable = sum(max(count - keep, 0) for count in remaining.values()) if keep else 0
+            self.stdout.write(
+                f"Would delete {len(duplicate_ids)} duplicate wraps and {prunable} wraps beyond the retention limit."
+            )
+            return
+
+        with transaction.atomic():
+            deleted = WrappedHistory.delete_with_catalog(WrappedHistory.objects.filter(id__in=duplicate_ids))
+            pruned = 0
+            for user_id, term in remaining:
+                pruned += WrappedHistory.enforce_retention(user_id, term, keep)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted} duplicate wraps and {pruned} wraps beyond the retention limit."
+        ))
+
+    def backfill(self, dry_run):
+        """
+        Fills in the term and content hash of wraps saved before those fields existed.
+
+        Args:
+            dry_run (bool): Compute the values without saving them.
+
+        Returns:
+            dict: Maps each backfilled wrap ID to its (term, content_hash).
+        """
+        stale = WrappedHistory.objects.filter(term="") | WrappedHistory.objects.filter(content_hash="")
+        stale = stale.prefetch_related("artists", "tracks")
+        updated = []
+        for wrap in stale.iterator(chunk_size=500):
+            if not wrap.term:
+                # Titles are saved as "<Term>-Term Wrapped"
+                wrap.term = wrap.title.split("-", 1)[0].lower()
+            if not wrap.content_hash:
+                wrap.content_hash = wrap.fingerprint()
+            updated.append(wrap)
+
+        if not dry_run:
+            WrappedHistory.objects.bulk_update(updated, ["term", "content_hash"], batch_size=500)
+        self.stdout.write(f"Backfilled {len(updated)} wraps.")
+        return {wrap.id: (wrap.term, wrap.content_hash) for wrap in updated}
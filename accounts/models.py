@@ -1,7 +1,10 @@
+import hashlib
+import json
+
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils.timezone import now
-# pylint: disable=E0307
+# pylint: disable=E0307,E1101
 class SpotifyToken(models.Model):
     """
     Model to store the Spotify OAuth token information for a user. This includes
@@ -22,13 +25,88 @@ class SpotifyToken(models.Model):
         return now() >= self.expires_at
 
 
+class Image(models.Model):
+    """
+    Model to store one size variant of a Spotify image. Each URL is stored once and
+    shared by every artist, track and wrap that uses it.
+    """
+    url = models.URLField(unique=True)
+    width = models.PositiveIntegerField(blank=True, null=True)
+    height = models.PositiveIntegerField(blank=True, null=True)
+
+    def __str__(self):
+        """
+        Returns a string representation of the Image object.
+
+        Returns:
+            str: The image URL.
+        """
+        return self.url
+
+    def as_dict(self):
+        """
+        Returns the image in the shape of a Spotify image object.
+
+        Returns:
+            dict: The image's url, width and height.
+        """
+        return {"url": self.url, "width": self.width, "height": self.height}
+
+    @classmethod
+    def resolve(cls, image_lists):
+        """
+        Gets or creates the rows for every image in the given Spotify image lists
+        using two queries.
+
+        Args:
+            image_lists (list): Lists of Spotify image objects (url, width, height).
+
+        Returns:
+            dict: Maps each image URL to its Image row.
+        """
+        variants = {image["url"]: image for images in image_lists for image in images}
+        if not variants:
+            return {}
+        cls.objects.bulk_create(
+            [cls(url=url, width=image.get("width"), height=image.get("height")) for url, image in variants.items()],
+            ignore_conflicts=True,
+        )
+        return cls.objects.in_bulk(list(variants), field_name="url")
+
+    @staticmethod
+    def closest(images, size=None):
+        """
+        Picks the variant whose longest side is closest to the requested size,
+        preferring the larger variant on ties.
+
+        Args:
+            images (list): Spotify image objects (url, width, height).
+            size (int): Requested size in pixels; None picks the largest variant.
+
+        Returns:
+            str: The chosen image URL, or None if there are no images.
+        """
+        if not images:
+            return None
+
+        def longest_side(image):
+            return max(image.get("width") or 0, image.get("height") or 0)
+
+        if size is None:
+            return max(images, key=longest_side)["url"]
+        return min(images, key=lambda image: (abs(longest_side(image) - size), -longest_side(image)))["url"]
+
+
 class Artist(models.Model):
     """
     Model to store information about an artist. This includes the artist's name,
-    image URL, description, and the top song associated with them.
+    images, description, and the top song associated with them. `image_url` is
+    only set on artists saved before images were stored in `Image`.
     """
+    spotify_id = models.CharField(max_length=64, blank=True, default="")
     name = models.CharField(max_length=255)
     image_url = models.URLField(blank=True, null=True)
+    images = models.ManyToManyField(Image, blank=True)
     top_song = models.CharField(max_length=255, blank=True, null=True)
     description = models.TextField(blank=True, null=True)
     song_preview = models.URLField(blank=True, null=True)
@@ -48,11 +126,13 @@ class Track(models.Model):
     Model to store information about a music track. This includes the track's name,
     the artist's name, the album it belongs to, and URLs for previewing and accessing the track.
     """
+    spotify_id = models.CharField(max_length=64, blank=True, default="")
     name = models.CharField(max_length=255)
     artist = models.CharField(max_length=255)
     album = models.CharField(max_length=255)
     preview_url = models.URLField(null=True, blank=True)
     track_url = models.URLField()
+    album_images = models.ManyToManyField(Image, blank=True)
 
     def __str__(self):
         """
@@ -68,14 +148,21 @@ class WrappedHistory(models.Model):
     """
     Model to store the user's Spotify wrapped data for a specific year or term. 
     This includes a list of top tracks, artists, and any associated images.
+    `image` is only set on wraps saved before covers were stored in `Image`.
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
+    term = models.CharField(max_length=20, blank=True, default="")
+    content_hash = models.CharField(max_length=64, blank=True, default="")
     image = models.URLField(blank=True, null=True)  # Use 'image' instead of 'image_url'
+    cover_images = models.ManyToManyField(Image, blank=True, related_name="+")
     artists = models.ManyToManyField(Artist)
     created_at = models.DateTimeField(auto_now_add=True)
     tracks = models.ManyToManyField(Track)
 
+    class Meta:
+        indexes = [models.Index(fields=["user", "term", "-created_at"])]
+
     def __str__(self):
         """
         Returns a string representation of the WrappedHistory object.
@@ -84,3 +171,81 @@ class WrappedHistory(models.Model):
             str: The title of the wrapped history (e.g., "2023 Wrapped").
         """
         return self.title
+
+    @staticmethod
+    def compute_content_hash(artist_ids, track_ids):
+        """
+        Computes a stable hash of a wrap's ordered artist and track ID lists.
+
+        Args:
+            artist_ids (list): Spotify IDs of the top artists, in rank order.
+            track_ids (list): Spotify IDs of the top tracks, in rank order.
+
+        Returns:
+            str: Hex-encoded SHA-256 digest of both lists.
+        """
+        payload = json.dumps([list(artist_ids), list(track_ids)], separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def fingerprint(self):
+        """
+        Recomputes the content hash from the stored artists and tracks. Used to
+        backfill wraps saved before content hashes were recorded, whose rows were
+        created in rank order; rows saved before Spotify IDs were recorded fall
+        back to the artist name and track URL.
+
+        Returns:
+            str: The content hash for this wrap.
+        """
+        artists = sorted(self.artists.all(), key=lambda artist: artist.id)
+        tracks = sorted(self.tracks.all(), key=lambda track: track.id)
+        artist_ids = [artist.spotify_id or artist.name for artist in artists]
+        track_ids = [track.spotify_id or track.track_url for track in tracks]
+        return self.compute_content_hash(artist_ids, track_ids)
+
+    @classmethod
+    def delete_with_catalog(cls, wraps):
+        """
+        Deletes the given wraps together with the artist, track and image rows
+        that nothing else references.
+
+        Args:
+            wraps (QuerySet): The wraps to delete.
+
+        Returns:
+            int: The number of wraps deleted.
+        """
+        wrap_ids = list(wraps.values_list("id", flat=True))
+        if not wrap_ids:
+            return 0
+        artist_ids = list(Artist.objects.filter(wrappedhistory__in=wrap_ids).values_list("id", flat=True))
+        track_ids = list(Track.objects.filter(wrappedhistory__in=wrap_ids).values_list("id", flat=True))
+        covers = cls.cover_images.through.objects
+        image_ids = set(covers.filter(wrappedhistory_id__in=wrap_ids).values_list("image_id", flat=True))
+        image_ids.update(Image.objects.filter(artist__in=artist_ids).values_list("id", flat=True))
+        image_ids.update(Image.objects.filter(track__in=track_ids).values_list("id", flat=True))
+        cls.objects.filter(id__in=wrap_ids).delete()
+        Artist.objects.filter(id__in=artist_ids, wrappedhistory__isnull=True).delete()
+        Track.objects.filter(id__in=track_ids, wrappedhistory__isnull=True).delete()
+        Image.objects.filter(id__in=image_ids, artist__isnull=True, track__isnull=True).exclude(
+            id__in=covers.values("image_id")
+        ).delete()
+        return len(wrap_ids)
+
+    @classmethod
+    def enforce_retention(cls, user, term, keep):
+        """
+        Keeps only the newest `keep` wraps of a term for a user.
+
+        Args:
+            user (User): The owner of the wraps.
+            term (str): The wrap term (e.g., 'short').
+            keep (int): How many wraps to keep; 0 or None disables pruning.
+
+        Returns:
+            int: The number of wraps deleted.
+        """
+        if not keep:
+            return 0
+        stale = cls.objects.filter(user=user, term=term).order_by("-created_at", "-id")[keep:]
+        return cls.delete_with_catalog(cls.objects.filter(id__in=list(stale.values_list("id", flat=True))))
@@ -0,0 +1,76 @@
+"""
+This module contains the cached user principal helpers shared by the JWT
+authentication class, the views and the invalidation signals. It does not import
+`rest_framework_simplejwt`, so importing the views does not load it.
+
+Principals are only cached when the default cache is shared between processes
+(e.g. Redis or Memcached). With a process-local cache, invalidation would only
+reach the worker that handled the change, so every request reads the database.
+"""
+# pylint: disable=E1101
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from .models import SpotifyToken
+
+# User fields copied into the cached principal
+PRINCIPAL_FIELDS = ("username", "email", "is_active", "is_staff", "is_superuser")
+
+
+def principal_cache_enabled():
+    """
+    Checks whether principals can be cached, i.e. the default cache is shared
+    between worker processes and AUTH_PRINCIPAL_CACHE_TTL is set.
+
+    Returns:
+        bool: True if `CachedJWTAuthentication` should cache principals.
+    """
+    return bool(settings.AUTH_PRINCIPAL_CACHE_TTL) and not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def version_key(user_id):
+    """
+    Returns the cache key holding the current principal version of a user.
+    """
+    return f"auth-principal-version:{user_id}"
+
+
+def principal_key(user_id, version):
+    """
+    Returns the cache key of a user's principal at a given version.
+    """
+    return f"auth-principal:{user_id}:{version}"
+
+
+def invalidate_cached_principal(user_id):
+    """
+    Drops the cached principal of a user. `accounts.signals` calls this when a
+    user is saved or deleted and when Spotify is linked or unlinked.
+
+    Args:
+        user_id (int): The ID of the user whose principal is stale.
+    """
+    key = version_key(user_id)
+    cache.delete(principal_key(user_id, cache.get(key, 0)))
+    cache.set(key, time.time_ns(), None)
+
+
+def is_spotify_linked(user):
+    """
+    Checks whether a user has linked their Spotify account, using the cached flag
+    on principals resolved by `CachedJWTAuthentication` when it is available.
+
+    Args:
+        user (User): The authenticated user.
+
+    Returns:
+        bool: True if the user has a stored Spotify token.
+    """
+    linked = getattr(user, "spotify_linked", None)
+    if linked is None:
+        linked = SpotifyToken.objects.filter(user=user).exists()
+    return linked
@@ -0,0 +1,203 @@
+"""
+This module provides opt-in request profiling for API views. A profiled request
+runs under cProfile while its database queries and Spotify calls are timed, and a
+summary with the hottest functions is kept in an in-process ring buffer that
+staff can read from `ProfileSamplesView`.
+
+A request is profiled when:
+- its `X-Profile-Token` header matches the PROFILING_TOKEN setting,
+- a staff user passes `?profile=1`, or
+- it is picked at random with probability PROFILING_SAMPLE_RATE.
+
+Python allows only one active cProfile profiler per process, so a request that
+is selected while another is being profiled runs unprofiled.
+"""
+import cProfile
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection
+from django.utils.timezone import now
+
+_lock = threading.Lock()
+_profiler_lock = threading.Lock()
+_samples = deque()
+_spotify_timing = ContextVar("spotify_timing", default=None)
+
+
+@contextmanager
+def track_spotify_call():
+    """
+    Times a Spotify HTTP call and adds it to the profile of the current request, if any.
+    Calls may run on other threads, so the totals are updated under the lock.
+    """
+    timing = _spotify_timing.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timing is not None:
+            with _lock:
+                timing["calls"] += 1
+                timing["ms"] += (time.perf_counter() - start) * 1000
+
+
+def get_samples():
+    """
+    Returns the stored profiles, newest first.
+
+    Returns:
+        list: Profile summaries as dictionaries.
+    """
+    with _lock:
+        return list(reversed(_samples))
+
+
+def clear_samples():
+    """
+    Empties the profile ring buffer.
+    """
+    with _lock:
+        _samples.clear()
+
+
+def _store(sample):
+    with _lock:
+        while len(_samples) >= max(settings.PROFILING_BUFFER_SIZE, 1):
+            _samples.popleft()
+        _samples.append(sample)
+
+
+def should_profile(request):
+    """
+    Decides whether a request should be profiled.
+
+    Args:
+        request (Request): The authenticated REST framework request.
+
+    Returns:
+        bool: True if the request asked for profiling and is allowed to, or was sampled.
+    """
+    token = settings.PROFILING_TOKEN
+    if token and request.headers.get("X-Profile-Token") == token:
+        return True
+    if request.query_params.get("profile") == "1" and request.user.is_staff:
+        return True
+    return random.random() < settings.PROFILING_SAMPLE_RATE
+
+
+class RequestProfile:
+    """
+    Collects the cProfile data, database time and Spotify time of one request.
+    """
+    def __init__(self, view_name, request):
+        self.view_name = view_name
+        self.request = request
+        self.profiler = cProfile.Profile()
+        self.db = {"queries": 0, "ms": 0.0}
+        self.spotify = {"calls": 0, "ms": 0.0}
+        self.stack = ExitStack()
+        self.started_at = None
+        self.start = None
+        self.spotify_token = None
+
+    def _time_query(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db["queries"] += 1
+            self.db["ms"] += (time.perf_counter() - start) * 1000
+
+    def begin(self):
+        """
+        Starts profiling the current thread, unless another request or profiling
+        tool is already using the profiler.
+
+        Returns:
+            bool: True if profiling started, in which case `end` must be called.
+        """
+        if not _profiler_lock.acquire(blocking=False):
+            return False
+        try:
+            self.profiler.enable()
+        except ValueError:
+            # Another profiling tool is active in this process
+            _profiler_lock.release()
+            return False
+
+        self.started_at = now()
+        self.start = time.perf_counter()
+        self.stack.enter_context(connection.execute_wrapper(self._time_query))
+        self.spotify_token = _spotify_timing.set(self.spotify)
+        return True
+
+    def end(self, status_code):
+        """
+        Stops profiling and stores the summary in the ring buffer.
+
+        Args:
+            status_code (int): The response status code.
+        """
+        try:
+            self.profiler.disable()
+            duration_ms = (time.perf_counter() - self.start) * 1000
+            _spotify_timing.reset(self.spotify_token)
+            self.stack.close()
+        finally:
+            _profiler_lock.release()
+
+        stats = pstats.Stats(self.profiler).stats
+        hottest = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:settings.PROFILING_TOP_N]
+        _store({
+            "view": self.view_name,
+            "method": self.request.method,
+            "path": self.request.path,
+            "status": status_code,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(duration_ms, 2),
+            "db": {"queries": self.db["queries"], "ms": round(self.db["ms"], 2)},
+            "spotify": {"calls": self.spotify["calls"], "ms": round(self.spotify["ms"], 2)},
+            "hot_functions": [
+                {
+                    "function": f"{filename}:{line}({name})",
+                    "calls": calls,
+                    "tottime_ms": round(tottime * 1000, 3),
+                    "cumtime_ms": round(cumtime * 1000, 3),
+                }
+                for (filename, line, name), (_, calls, tottime, cumtime, _) in hottest
+            ],
+        })
+
+
+class ProfiledViewMixin:
+    """
+    Mixin for `APIView` subclasses that profiles requests selected by `should_profile`.
+    Profiling starts after authentication, so staff checks see the real user, and
+    stops when `dispatch` returns or raises. Unhandled exceptions are recorded as 500.
+    """
+    def dispatch(self, request, *args, **kwargs):
+        self._request_profile = None
+        status_code = 500
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            profile = self._request_profile
+            if profile is not None:
+                self._request_profile = None
+                profile.end(status_code)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if should_profile(request):
+            profile = RequestProfile(type(self).__name__, request)
+            if profile.begin():
+                self._request_profile = profile
@@ -0,0 +1,63 @@
+"""
+This module contains faster REST framework renderers for the large wrap payloads.
+`orjson` and `msgpack` are optional: without orjson, `ORJSONRenderer` falls back
+to the standard JSON renderer, and without msgpack the msgpack content type is
+not offered.
+"""
+# pylint: disable=E1101
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renders `application/json` with orjson, which writes bytes directly. Values
+    orjson cannot serialize natively, and datetimes, go through REST framework's
+    JSON encoder.
+    Requests that ask for indented output use the standard renderer.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        # Pass datetimes through to REST framework's encoder so they keep its format
+        return orjson.dumps(
+            data,
+            default=_encoder.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+
+class MsgPackRenderer(BaseRenderer):
+    """
+    Renders `application/x-msgpack` for clients that send that Accept header.
+    """
+    media_type = "application/x-msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_encoder.default, use_bin_type=True)
+
+
+# Renderers for the wrap endpoints; the first is used when the client has no preference
+WRAP_RENDERER_CLASSES = [ORJSONRenderer]
+if msgpack is not None:
+    WRAP_RENDERER_CLASSES.append(MsgPackRenderer)
+WRAP_RENDERER_CLASSES.append(BrowsableAPIRenderer)
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import User
 from rest_framework import serializers
 
+from .hashing import hash_password
 from .models import WrappedHistory
 
 
@@ -14,7 +15,7 @@ class RegisterSerializer(serializers.ModelSerializer):
     - `password`: The user's password (write-only).
 
     Methods:
-    - `create`: Custom method to create a new user instance using Django's `create_user` method.
+    - `create`: Custom method to create a new user instance, hashing the password on the bounded hashing pool.
     """
     password = serializers.CharField(write_only=True)  # Ensure password is write-only
 
@@ -24,19 +25,24 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """
-        Create a new user instance with the validated data.
+        Create a new user instance with the validated data. Mirrors `create_user`,
+        but hashes the password through `hash_password`.
 
         Args:
             validated_data (dict): The validated data for the user.
 
         Returns:
             User: The created user instance.
+
+        Raises:
+            HashingCapacityExceeded: If the hashing pool is saturated (HTTP 429).
         """
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password']
+        user = User(
+            username=User.normalize_username(validated_data['username']),
+            email=User.objects.normalize_email(validated_data['email']),
+            password=hash_password(validated_data['password'], signup=True),
         )
+        user.save()
         return user
 
 
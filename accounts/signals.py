@@ -0,0 +1,59 @@
+"""
+This module contains the signal receivers that drop cached user principals (see
+`accounts.principals`) whenever the user or their Spotify link changes, so
+deactivated, demoted, deleted or newly linked users are seen on the next request.
+
+Signals are not sent by `QuerySet.update()` or `QuerySet.delete()` on User rows;
+call `invalidate_cached_principal` after such bulk changes.
+"""
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .principals import PRINCIPAL_FIELDS, invalidate_cached_principal
+from .models import SpotifyToken
+
+
+def _invalidate(user_id):
+    # Invalidate now for this transaction and again on commit, in case another
+    # request cached the old values before the change was committed
+    invalidate_cached_principal(user_id)
+    transaction.on_commit(lambda: invalidate_cached_principal(user_id))
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_principal(sender, instance, update_fields=None, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drops the principal of a saved user, unless only fields the principal does
+    not store (e.g. `last_login`) were updated.
+    """
+    if update_fields is not None and not set(update_fields) & {*PRINCIPAL_FIELDS, "password"}:
+        return
+    _invalidate(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_user_principal(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drops the principal of a deleted user.
+    """
+    _invalidate(instance.pk)
+
+
+@receiver(post_save, sender=SpotifyToken)
+def invalidate_linked_principal(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drops the principal of a user who linked Spotify. Token refreshes do not
+    change whether the user is linked, so they keep the principal.
+    """
+    if created:
+        _invalidate(instance.user_id)
+
+
+@receiver(post_delete, sender=SpotifyToken)
+def invalidate_unlinked_principal(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drops the principal of a user whose Spotify token was deleted.
+    """
+    _invalidate(instance.user_id)
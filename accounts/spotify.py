@@ -0,0 +1,86 @@
+"""
+This module contains the HTTP helpers used to call the Spotify Web API and the
+Spotify accounts service. `requests` is imported on first use rather than when
+the views are imported, so process startup does not pay for it. All calls share
+one pooled session, so connections to Spotify are reused across requests. Every
+call has a SPOTIFY_HTTP_TIMEOUT, so a hung Spotify cannot hold the shared fetch
+threads indefinitely.
+"""
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+from .profiling import track_spotify_call
+
+SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
+
+_lock = threading.Lock()
+_client = {"session": None, "executor": None}
+
+
+def _get_client():
+    """
+    Returns the shared session and fetch executor, creating them on first use.
+    """
+    with _lock:
+        if _client["session"] is None:
+            import requests  # pylint: disable=import-outside-toplevel
+
+            pool_size = settings.SPOTIFY_HTTP_POOL_SIZE
+            session = requests.Session()
+            session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=pool_size))
+            _client["executor"] = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="spotify")
+            _client["session"] = session
+        return _client["session"], _client["executor"]
+
+
+def get(url, access_token):
+    """
+    Sends an authenticated GET request to the Spotify Web API.
+
+    Args:
+        url (str): The API URL to fetch.
+        access_token (str): The user's Spotify access token.
+
+    Returns:
+        requests.Response: The Spotify response.
+    """
+    session, _ = _get_client()
+    with track_spotify_call():
+        return session.get(
+            url, headers={"Authorization": f"Bearer {access_token}"}, timeout=settings.SPOTIFY_HTTP_TIMEOUT
+        )
+
+
+def get_all(urls, access_token):
+    """
+    Sends authenticated GET requests for several URLs concurrently.
+
+    Args:
+        urls (list): The API URLs to fetch.
+        access_token (str): The user's Spotify access token.
+
+    Returns:
+        list: The Spotify responses, in the order of `urls`.
+    """
+    _, executor = _get_client()
+    # Run each call in a copy of the caller's context so request profiling still sees it
+    futures = [executor.submit(contextvars.copy_context().run, get, url, access_token) for url in urls]
+    return [future.result() for future in futures]
+
+
+def request_token(data):
+    """
+    Posts a token request (authorization code or refresh) to the Spotify accounts service.
+
+    Args:
+        data (dict): The form fields of the token request.
+
+    Returns:
+        requests.Response: The Spotify response.
+    """
+    session, _ = _get_client()
+    with track_spotify_call():
+        return session.post(SPOTIFY_TOKEN_URL, data=data, timeout=settings.SPOTIFY_HTTP_TIMEOUT)
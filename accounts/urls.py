@@ -1,6 +1,6 @@
 # accounts/urls.py
 from django.urls import path
-from .views import RegisterView, SpotifyAuthView, SpotifyCallbackView, FetchSpotifyWrappedView, SpotifyAuthURLView, ProtectedView, SpotifyLinkCheckView, SpotifyWrappedDataView, UserProfileView, WrappedHistoryView, get_user_tracks, delete_account, delete_wrap
+from .views import RegisterView, SpotifyAuthView, SpotifyCallbackView, FetchSpotifyWrappedView, SpotifyAuthURLView, ProtectedView, SpotifyLinkCheckView, SpotifyWrappedDataView, SpotifyWrappedBatchView, UserProfileView, WrappedHistoryView, ProfileSamplesView, get_user_tracks, delete_account, delete_wrap
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 urlpatterns = [
@@ -11,6 +11,7 @@ urlpatterns = [
     path("protected/", ProtectedView.as_view(), name="protected_view"),
     path('spotify/auth/', SpotifyAuthView.as_view(), name='spotify-auth'),
     path("spotify/callback/", SpotifyCallbackView.as_view(), name="spotify-callback"),
+    path('spotify/wrapped-data/batch/', SpotifyWrappedBatchView.as_view(), name='spotify-wrapped-data-batch'),
     path('spotify/wrapped-data/<str:term>/', SpotifyWrappedDataView.as_view(), name='spotify-wrapped-data'),
     path('spotify/wrapped-data/<str:term>/<int:id>/', FetchSpotifyWrappedView.as_view(), name="spotify-wrapped-data"),
     path('spotify/auth-url/', SpotifyAuthURLView.as_view(), name='spotify-auth-url'),
@@ -19,4 +20,5 @@ urlpatterns = [
     path('spotify/user-tracks/<str:term>/', get_user_tracks, name='user-tracks'),
     path('users/delete/', delete_account, name='delete_account'),
     path('wrapped-history/<int:id>/delete/', delete_wrap, name='delete_wrap'),
+    path('profiling/samples/', ProfileSamplesView.as_view(), name='profiling-samples'),
 ]
\ No newline at end of file
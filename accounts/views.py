@@ -4,32 +4,94 @@ Spotify authentication, and handling Spotify Wrapped data using Django REST Fram
 """
 # pylint: disable=E0307,W3101,E1101,W0631,W0719,W0718,W0611,W0622
 import logging
-import os
 from datetime import timedelta, datetime
 from urllib.parse import urlencode
 
-import requests
+from django.conf import settings
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.http import JsonResponse
 from django.utils.timezone import now
-from dotenv import load_dotenv
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .models import Artist, SpotifyToken, Track, WrappedHistory
+from . import spotify
+from .coalescing import RequestCoalescer
+from .models import Artist, Image, SpotifyToken, Track, WrappedHistory
+from .principals import is_spotify_linked
+from .profiling import ProfiledViewMixin, clear_samples, get_samples
+from .renderers import WRAP_RENDERER_CLASSES
 from .serializers import RegisterSerializer
 
-# Load environment variables
-load_dotenv()
-SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID')
-SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET')
-SPOTIFY_REDIRECT_URI = os.getenv('SPOTIFY_REDIRECT_URI')
+WRAPPED_TERMS = ['short', 'medium', 'long', 'christmas', 'halloween']
+
+# In-flight wrap fetches, keyed by (user ID, scope)
+wrap_generations = RequestCoalescer()
+
+
+def parse_image_size(request):
+    """
+    Reads the optional `image_size` query parameter, the preferred image size in pixels.
+
+    Args:
+        request (Request): The REST framework request.
+
+    Returns:
+        int: The requested size, or None to get the largest images.
+
+    Raises:
+        ValueError: If the parameter is not a positive integer.
+    """
+    image_size = request.query_params.get("image_size")
+    if image_size is None:
+        return None
+    image_size = int(image_size)
+    if image_size <= 0:
+        raise ValueError(image_size)
+    return image_size
+
+
+def run_wrap_generation(request, scope, fetch, render):
+    """
+    Runs a wrap generation for a request. Requests of the same user and scope in
+    flight share one Spotify fetch and save, and retries carrying the same
+    Idempotency-Key header reuse the original fetch. Each request then renders
+    the fetched data itself, so requests differing only in e.g. `image_size` still
+    share the fetch.
+
+    Args:
+        request (Request): The REST framework request.
+        scope (str): The endpoint and what it fetches, e.g. 'term:short' or
+            'batch:short,long'. Requests only share fetches and replays within a scope.
+        fetch (callable): Zero-argument function that fetches and saves the wraps,
+            returning the fetched data (or an error payload) and status code.
+        render (callable): Builds this request's response payload from the fetched data.
+
+    Returns:
+        Response: The rendered response, or the error payload of a failed fetch.
+    """
+    user = request.user
+    idempotency_key = request.headers.get("Idempotency-Key")
+    cache_key = f"wrapped-idempotency:{user.id}:{scope}:{idempotency_key}"
+    if idempotency_key:
+        fetched = cache.get(cache_key)
+        if fetched is not None:
+            return Response(render(fetched), status=status.HTTP_200_OK)
+
+    fetched, status_code = wrap_generations.run((user.id, scope), fetch)
+    if status_code != status.HTTP_200_OK:
+        return Response(fetched, status=status_code)
+
+    if idempotency_key:
+        cache.set(cache_key, fetched, settings.IDEMPOTENCY_KEY_TTL)
+    return Response(render(fetched), status=status_code)
 
 
 class RegisterView(APIView):
@@ -75,7 +137,7 @@ class UserProfileView(APIView):
         return Response({
             "username": user.username,
             "email": user.email,
-            "spotify_linked": hasattr(user, "spotifytoken"),
+            "spotify_linked": is_spotify_linked(user),
         })
 
 
@@ -87,8 +149,8 @@ class SpotifyAuthView(APIView):
     def get(self, request):  # pylint: disable=unused-argument
         url = (
             f"https://accounts.spotify.com/authorize"
-            f"?response_type=code&client_id={SPOTIFY_CLIENT_ID}"
-            f"&redirect_uri={SPOTIFY_REDIRECT_URI}"
+            f"?response_type=code&client_id={settings.SPOTIFY_CLIENT_ID}"
+            f"&redirect_uri={settings.SPOTIFY_REDIRECT_URI}"
             f"&scope=user-top-read"
         )
         return Response({"url": url}, status=status.HTTP_200_OK)
@@ -119,16 +181,13 @@ class SpotifyCallbackView(APIView):
         if not code:
             return Response({"error": "No authorization code provided."}, status=status.HTTP_400_BAD_REQUEST)
 
-        response = requests.post(
-            "https://accounts.spotify.com/api/token",
-            data={
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": SPOTIFY_REDIRECT_URI,
-                "client_id": SPOTIFY_CLIENT_ID,
-                "client_secret": SPOTIFY_CLIENT_SECRET,
-            },
-        )
+        response = spotify.request_token({
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": settings.SPOTIFY_REDIRECT_URI,
+            "client_id": settings.SPOTIFY_CLIENT_ID,
+            "client_secret": settings.SPOTIFY_CLIENT_SECRET,
+        })
 
         if response.status_code != 200:
             return Response({"error": response.json().get("error_description", "Unknown error")}, status=status.HTTP_400_BAD_REQUEST)
@@ -160,11 +219,10 @@ class FetchSpotifyWrappedView(APIView):
         except SpotifyToken.DoesNotExist:
             return Response({"error": "Spotify account not linked."}, status=400)
 
-        headers = {"Authorization": f"Bearer {spotify_token.access_token}"}
         term_mapping = {"short": "short_term", "medium": "medium_term", "long": "long_term"}
 
         url = f"https://api.spotify.com/v1/me/top/artists?time_range={term_mapping.get(term, 'long_term')}&limit=10"
-        response = requests.get(url, headers=headers)
+        response = spotify.get(url, spotify_token.access_token)
 
         if response.status_code == 200:
             return Response(response.json(), status=200)
@@ -179,9 +237,9 @@ class SpotifyAuthURLView(APIView):
     """
     def get(self, request):  # pylint: disable=unused-argument
         params = {
-            "client_id": SPOTIFY_CLIENT_ID,
+            "client_id": settings.SPOTIFY_CLIENT_ID,
             "response_type": "code",
-            "redirect_uri": SPOTIFY_REDIRECT_URI,
+            "redirect_uri": settings.SPOTIFY_REDIRECT_URI,
             "scope": "user-top-read",
         }
         url = f"https://accounts.spotify.com/authorize?{urlencode(params)}"
@@ -195,146 +253,305 @@ class SpotifyLinkCheckView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):  # pylint: disable=unused-argument
-        user = request.user
-        spotify_token = SpotifyToken.objects.filter(user=user).first()
-        return Response({"linked": bool(spotify_token)}, status=200)
+        return Response({"linked": is_spotify_linked(request.user)}, status=200)
 
     
-class SpotifyWrappedDataView(APIView):
+class SpotifyWrappedDataView(ProfiledViewMixin, APIView):
     """
     Fetches and stores the user's Spotify wrapped data (top artists and tracks)
     for a specific term (short, medium, long, christmas, halloween).
     """
     permission_classes = [IsAuthenticated]
+    renderer_classes = WRAP_RENDERER_CLASSES
 
-    def get(self, request, term): 
+    def get(self, request, term):
         # Validate term
-        if term not in ['short', 'medium', 'long', 'christmas', 'halloween']:
+        if term not in WRAPPED_TERMS:
             return Response({"error": "Invalid term"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            image_size = parse_image_size(request)
+        except ValueError:
+            return Response({"error": "image_size must be a positive integer."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Retrieve user's Spotify token
         user = request.user
+        return run_wrap_generation(
+            request,
+            f"term:{term}",
+            lambda: self.fetch_wraps(user, [term]),
+            lambda fetched: self.build_wrap_payload(*fetched[term], image_size),
+        )
+
+    def fetch_wraps(self, user, terms):
+        """
+        Fetches the user's top artists and tracks for each term from Spotify
+        concurrently and saves the new wraps to their history in one transaction.
+
+        Args:
+            user (User): The authenticated user.
+            terms (list): The wrap terms (e.g., ['short', 'long']).
+
+        Returns:
+            tuple: The (artists_data, tracks_data) Spotify responses keyed by term
+                (or an error payload) and HTTP status code.
+        """
+        spotify_token, error = self.get_spotify_token(user)
+        if error:
+            return error, status.HTTP_400_BAD_REQUEST
+
+        # Fetch every term's top artists and tracks at once
+        urls = []
+        for term in terms:
+            time_range = self.get_time_range(term)
+            urls.append(f"https://api.spotify.com/v1/me/top/artists?time_range={time_range}&limit=10")
+            urls.append(f"https://api.spotify.com/v1/me/top/tracks?time_range={time_range}&limit=50")
+        responses = spotify.get_all(urls, spotify_token.access_token)
+
+        fetched = {}
+        for index, term in enumerate(terms):
+            artists_response, tracks_response = responses[2 * index:2 * index + 2]
+            if artists_response.status_code != 200 or tracks_response.status_code != 200:
+                return {
+                    "error": "Failed to fetch Spotify data.",
+                    "term": term,
+                    "artist_details": artists_response.json(),
+                    "track_details": tracks_response.json()
+                }, status.HTTP_400_BAD_REQUEST
+            fetched[term] = (artists_response.json(), tracks_response.json())
+
+        self.save_new_wraps(user, fetched)
+        return fetched, status.HTTP_200_OK
+
+    def get_spotify_token(self, user):
+        """
+        Loads the user's Spotify token, refreshing it if it has expired.
+
+        Args:
+            user (User): The authenticated user.
+
+        Returns:
+            tuple: The SpotifyToken and None, or None and an error payload.
+        """
         try:
             spotify_token = SpotifyToken.objects.get(user=user)
         except SpotifyToken.DoesNotExist:
-            return Response({"error": "Spotify account not linked."}, status=status.HTTP_400_BAD_REQUEST)
+            return None, {"error": "Spotify account not linked."}
 
         # Refresh token if expired
         if spotify_token.expires_at <= now():
-            token_response = self.refresh_spotify_token(spotify_token.refresh_token)
-            if "error" in token_response:
-                return Response({"error": "Failed to refresh Spotify token."}, status=status.HTTP_400_BAD_REQUEST)
+            response = spotify.request_token({
+                "grant_type": "refresh_token",
+                "refresh_token": spotify_token.refresh_token,
+                "client_id": settings.SPOTIFY_CLIENT_ID,
+                "client_secret": settings.SPOTIFY_CLIENT_SECRET,
+            })
+            if response.status_code != 200:
+                return None, {"error": "Failed to refresh Spotify token."}
+            token_response = response.json()
             spotify_token.access_token = token_response["access_token"]
+            # Spotify may rotate the refresh token
+            spotify_token.refresh_token = token_response.get("refresh_token", spotify_token.refresh_token)
             spotify_token.expires_at = now() + timedelta(seconds=token_response["expires_in"])
             spotify_token.save()
+        return spotify_token, None
+
+    def get_time_range(self, term):
+        """
+        Maps a term to a Spotify API time range, using custom logic for Christmas/Halloween.
+
+        Args:
+            term (str): The wrap term.
 
-        # Map terms to Spotify API time ranges or custom logic for Christmas/Halloween
-        time_range_mapping = {
-            'short': 'short_term',
-            'medium': 'medium_term',
-            'long': 'long_term',
-            'christmas': self.get_christmas_time_range(),  # Custom function to get the Christmas time range
-            'halloween': self.get_halloween_time_range(),  # Custom function to get the Halloween time range
+        Returns:
+            str: The Spotify time range (e.g., 'short_term').
+        """
+        if term == 'christmas':
+            return self.get_christmas_time_range()
+        if term == 'halloween':
+            return self.get_halloween_time_range()
+        return f"{term}_term"
+
+    def build_wrap_payload(self, artists_data, tracks_data, image_size=None):
+        """
+        Builds the structured response for one wrap.
+
+        Args:
+            artists_data (dict): Spotify top-artists response.
+            tracks_data (dict): Spotify top-tracks response.
+            image_size (int): Preferred image size in pixels; None picks the largest.
+
+        Returns:
+            dict: The wrap's artists and tracks.
+        """
+        return {
+            'artists': [
+                {
+                    'id': artist['id'],
+                    'name': artist['name'],
+                    'genres': artist.get('genres', []),
+                    'image': Image.closest(artist['images'], image_size),
+                    'popularity': artist['popularity']
+                }
+                for artist in artists_data['items']
+            ],
+            'tracks': [
+                {
+                    'id': track['id'],
+                    'name': track['name'],
+                    'album': track['album']['name'],
+                    'album_image': Image.closest(track['album']['images'], image_size),
+                    'artists': [{'id': artist['id'], 'name': artist['name']} for artist in track['artists']],
+                    'preview_url': track['preview_url'],
+                    'popularity': track['popularity']
+                }
+                for track in tracks_data['items']
+            ]
         }
 
-        # Determine the correct API URL based on the term
-        if term == 'christmas' or term == 'halloween':
-            # These terms use specific seasonal playlists or time ranges
-            artists_api_url = f"https://api.spotify.com/v1/me/top/artists?time_range={time_range_mapping[term]}&limit=10"
-            tracks_api_url = f"https://api.spotify.com/v1/me/top/tracks?time_range={time_range_mapping[term]}&limit=50"
-        else:
-            # Default behavior for short, medium, and long term wrapped
-            artists_api_url = f"https://api.spotify.com/v1/me/top/artists?time_range={time_range_mapping[term]}&limit=10"
-            tracks_api_url = f"https://api.spotify.com/v1/me/top/tracks?time_range={time_range_mapping[term]}&limit=50"
-
-        # Fetch data from Spotify API
-        artists_response = requests.get(artists_api_url, headers={"Authorization": f"Bearer {spotify_token.access_token}"})
-        tracks_response = requests.get(tracks_api_url, headers={"Authorization": f"Bearer {spotify_token.access_token}"})
-
-        if artists_response.status_code == 200 and tracks_response.status_code == 200:
-            artists_data = artists_response.json()
-            tracks_data = tracks_response.json()
-
-            # Save Wrapped history
-            wrapped_history = WrappedHistory.objects.create(
-                user=user,
-                title=f"{term.capitalize()}-Term Wrapped",
-                image=artists_data["items"][0]["images"][0]["url"] if artists_data["items"] and artists_data["items"][0]["images"] else "",
-            )
+    def save_new_wraps(self, user, fetched):
+        """
+        Saves the fetched wraps, skipping any that is identical to the previous wrap
+        for its term, and applies the retention policy to the terms that changed.
 
-            # Save top artists
-            for artist_data in artists_data["items"]:
-                artist = Artist.objects.create(
-                    name=artist_data["name"],
-                    image_url=artist_data["images"][0]["url"] if artist_data["images"] else "",
-                    description=", ".join(artist_data.get("genres", [])) if artist_data.get("genres") else "No genre available",
-                    song_preview=artist_data.get("external_urls", {}).get("spotify", ""),
-                )
+        Args:
+            user (User): The owner of the wraps.
+            fetched (dict): Maps each term to its (artists_data, tracks_data) responses.
 
-                top_song_id = None
-                for track_data in tracks_data["items"]:
-                    if any(artist.name == track_artist["name"] for track_artist in track_data["artists"]):
-                        top_song_id = track_data["id"]
-                        break
+        Returns:
+            list: The saved WrappedHistory rows.
+        """
+        content_hashes = {
+            term: WrappedHistory.compute_content_hash(
+                [artist["id"] for artist in artists_data["items"]],
+                [track["id"] for track in tracks_data["items"]],
+            )
+            for term, (artists_data, tracks_data) in fetched.items()
+        }
+        latest_hashes = {}
+        if settings.WRAPPED_HISTORY_SKIP_DUPLICATES:
+            # Only the newest wrap of each term matters, found through the (user, term, -created_at) index
+            latest_hashes = {
+                term: WrappedHistory.objects.filter(user=user, term=term)
+                .order_by('-created_at', '-id')
+                .values_list('content_hash', flat=True)
+                .first()
+                for term in fetched
+            }
+
+        new_wraps = [
+            (term, content_hashes[term], artists_data, tracks_data)
+            for term, (artists_data, tracks_data) in fetched.items()
+            if latest_hashes.get(term) != content_hashes[term]
+        ]
+        if not new_wraps:
+            return []
 
-                if top_song_id:
-                    song_preview_url = f"https://open.spotify.com/track/{top_song_id}"
-                    artist.song_preview = song_preview_url
-                    artist.top_song = track_data["name"]
-                    artist.save()
+        with transaction.atomic():
+            histories = self.save_wrapped_histories(user, new_wraps)
+            for term, _, _, _ in new_wraps:
+                WrappedHistory.enforce_retention(user, term, settings.WRAPPED_HISTORY_RETENTION)
+        return histories
 
-                wrapped_history.artists.add(artist)
+    def save_wrapped_histories(self, user, wraps):
+        """
+        Persists wraps and their top artists and tracks with bulk inserts. Image
+        rows are shared; artist and track rows belong to a single wrap.
 
-            wrapped_history.save()
+        Args:
+            user (User): The owner of the wraps.
+            wraps (list): (term, content_hash, artists_data, tracks_data) tuples, where
+                the data are the Spotify top-artists and top-tracks responses.
 
-            # Save tracks
+        Returns:
+            list: The saved WrappedHistory rows.
+        """
+        images = Image.resolve(
+            [artist_data["images"] for _, _, artists_data, _ in wraps for artist_data in artists_data["items"]]
+            + [track_data["album"]["images"] for _, _, _, tracks_data in wraps for track_data in tracks_data["items"]]
+        )
+        histories = WrappedHistory.objects.bulk_create([
+            WrappedHistory(user=user, title=f"{term.capitalize()}-Term Wrapped", term=term, content_hash=content_hash)
+            for term, content_hash, _, _ in wraps
+        ])
+
+        # Every wrap gets its own artist and track rows, inserted in rank order: the
+        # M2M links have no position, so the wrap lists them in insertion order
+        artists = []
+        tracks = []
+        cover_images = []
+        for history, (_, _, artists_data, tracks_data) in zip(histories, wraps):
+            if artists_data["items"]:
+                cover_images += [
+                    WrappedHistory.cover_images.through(wrappedhistory=history, image=images[image["url"]])
+                    for image in artists_data["items"][0]["images"]
+                ]
+            for artist_data in artists_data["items"]:
+                artists.append((history, self.build_artist(artist_data, tracks_data), artist_data["images"]))
             for track_data in tracks_data["items"]:
-                track = Track.objects.create(
+                track = Track(
+                    spotify_id=track_data["id"],
                     name=track_data["name"],
                     artist=", ".join([artist["name"] for artist in track_data["artists"]]),
                     album=track_data["album"]["name"],
                     preview_url=track_data["preview_url"],
                     track_url=track_data["external_urls"]["spotify"]
                 )
-                wrapped_history.tracks.add(track)
+                tracks.append((history, track, track_data["album"]["images"]))
 
-            wrapped_history.save()
+        Artist.objects.bulk_create([artist for _, artist, _ in artists])
+        Track.objects.bulk_create([track for _, track, _ in tracks])
 
-            # Return structured response
-            wrapped_data = {
-                'artists': [
-                    {
-                        'id': artist['id'],
-                        'name': artist['name'],
-                        'genres': artist.get('genres', []),
-                        'image': artist['images'][0]['url'] if artist['images'] else None,
-                        'popularity': artist['popularity']
-                    }
-                    for artist in artists_data['items']
-                ],
-                'tracks': [
-                    {
-                        'id': track['id'],
-                        'name': track['name'],
-                        'album': track['album']['name'],
-                        'album_image': track['album']['images'][0]['url'] if track['album']['images'] else None,
-                        'artists': [{'id': artist['id'], 'name': artist['name']} for artist in track['artists']],
-                        'preview_url': track['preview_url'],
-                        'popularity': track['popularity']
-                    }
-                    for track in tracks_data['items']
-                ]
-            }
+        WrappedHistory.cover_images.through.objects.bulk_create(cover_images, ignore_conflicts=True)
+        WrappedHistory.artists.through.objects.bulk_create(
+            [WrappedHistory.artists.through(wrappedhistory=history, artist=artist) for history, artist, _ in artists],
+            ignore_conflicts=True,
+        )
+        WrappedHistory.tracks.through.objects.bulk_create(
+            [WrappedHistory.tracks.through(wrappedhistory=history, track=track) for history, track, _ in tracks],
+            ignore_conflicts=True,
+        )
+        Artist.images.through.objects.bulk_create(
+            [
+                Artist.images.through(artist=artist, image=images[image["url"]])
+                for _, artist, artist_images in artists
+                for image in artist_images
+            ],
+            ignore_conflicts=True,
+        )
+        Track.album_images.through.objects.bulk_create(
+            [
+                Track.album_images.through(track=track, image=images[image["url"]])
+                for _, track, album_images in tracks
+                for image in album_images
+            ],
+            ignore_conflicts=True,
+        )
+        return histories
+
+    def build_artist(self, artist_data, tracks_data):
+        """
+        Builds an unsaved Artist whose top song is their highest-ranked track among
+        the user's top tracks.
+
+        Args:
+            artist_data (dict): Spotify artist object.
+            tracks_data (dict): Spotify top-tracks response.
+
+        Returns:
+            Artist: The unsaved artist.
+        """
+        artist = Artist(
+            spotify_id=artist_data["id"],
+            name=artist_data["name"],
+            description=", ".join(artist_data.get("genres", [])) if artist_data.get("genres") else "No genre available",
+            song_preview=artist_data.get("external_urls", {}).get("spotify", ""),
+        )
+        for track_data in tracks_data["items"]:
+            if any(artist.name == track_artist["name"] for track_artist in track_data["artists"]):
+                artist.song_preview = f"https://open.spotify.com/track/{track_data['id']}"
+                artist.top_song = track_data["name"]
+                break
+        return artist
 
-            return Response(wrapped_data, status=status.HTTP_200_OK)
-        
-        else:
-            return Response({
-                "error": "Failed to fetch Spotify data.",
-                "artist_details": artists_response.json(),
-                "track_details": tracks_response.json()
-            }, status=status.HTTP_400_BAD_REQUEST)
-    
     def get_christmas_time_range(self):
         """
         Defines the time range for Christmas (e.g., from Dec 1 to Dec 31).
@@ -353,25 +570,62 @@ class SpotifyWrappedDataView(APIView):
         if current_date.month == 10:
             return 'short_term'  # Example, could adjust as necessary
         return 'medium_term'  # Fallback
-class WrappedHistoryView(APIView):
+
+
+class SpotifyWrappedBatchView(SpotifyWrappedDataView):
+    """
+    Fetches and stores the user's Spotify wrapped data for several terms in one
+    request (e.g., `?terms=short,medium,long`, the default). The terms share one
+    token check and concurrent Spotify requests, and their new wraps are saved in
+    a single transaction. Returns the wraps keyed by term.
+    """
+    def get(self, request):  # pylint: disable=arguments-differ
+        terms = list(dict.fromkeys(request.query_params.get("terms", "short,medium,long").split(",")))
+        if any(term not in WRAPPED_TERMS for term in terms):
+            return Response({"error": "Invalid term"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            image_size = parse_image_size(request)
+        except ValueError:
+            return Response({"error": "image_size must be a positive integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        user = request.user
+        return run_wrap_generation(
+            request,
+            f"batch:{','.join(terms)}",
+            lambda: self.fetch_wraps(user, terms),
+            lambda fetched: {term: self.build_wrap_payload(*fetched[term], image_size) for term in terms},
+        )
+
+
+class WrappedHistoryView(ProfiledViewMixin, APIView):
     """
     Retrieves the Spotify wrapped history for the authenticated user.
     """
     permission_classes = [IsAuthenticated]
+    renderer_classes = WRAP_RENDERER_CLASSES
 
     def get(self, request):  # pylint: disable=unused-argument
+        try:
+            image_size = parse_image_size(request)
+        except ValueError:
+            return Response({"error": "image_size must be a positive integer."}, status=status.HTTP_400_BAD_REQUEST)
+
         user = request.user
-        wrapped_history = WrappedHistory.objects.filter(user=user).order_by('-created_at')
+        wrapped_history = (
+            WrappedHistory.objects.filter(user=user)
+            .order_by('-created_at')
+            .prefetch_related('cover_images', 'artists__images')
+        )
 
         response_data = [
             {
                 "id": history.id,
                 "title": history.title,
-                "image": history.image,
+                "image": Image.closest([image.as_dict() for image in history.cover_images.all()], image_size) or history.image,
                 "artists": [
                     {
                         "name": artist.name,
-                        "images": [{"url": artist.image_url}],
+                        "images": self.artist_images(artist, image_size),
                         "top_song": artist.top_song,
                         "description": artist.description,
                         "song_preview": artist.song_preview,
@@ -384,6 +638,40 @@ class WrappedHistoryView(APIView):
 
         return Response(response_data, status=200)
 
+    def artist_images(self, artist, image_size):
+        """
+        Lists an artist's image variants, largest first, or only the variant closest
+        to `image_size` when a size was requested.
+
+        Args:
+            artist (Artist): The artist, with `images` prefetched.
+            image_size (int): Preferred image size in pixels, or None.
+
+        Returns:
+            list: Spotify-style image objects.
+        """
+        variants = [image.as_dict() for image in artist.images.all()]
+        if not variants:
+            return [{"url": artist.image_url}]
+        if image_size is not None:
+            url = Image.closest(variants, image_size)
+            return [variant for variant in variants if variant["url"] == url]
+        return sorted(variants, key=lambda variant: max(variant["width"] or 0, variant["height"] or 0), reverse=True)
+
+
+class ProfileSamplesView(APIView):
+    """
+    Lets staff read or clear the request profiles collected by profiled views.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):  # pylint: disable=unused-argument
+        return Response(get_samples(), status=status.HTTP_200_OK)
+
+    def delete(self, request):  # pylint: disable=unused-argument
+        clear_samples()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
 
 def fetch_spotify_top_tracks(access_token, time_range):
     """
@@ -400,9 +688,8 @@ def fetch_spotify_top_tracks(access_token, time_range):
         Exception: If the Spotify API returns an error.
     """
     url = f"https://api.spotify.com/v1/me/top/tracks?time_range={time_range}&limit=50"
-    headers = {"Authorization": f"Bearer {access_token}"}
 
-    response = requests.get(url, headers=headers)
+    response = spotify.get(url, access_token)
     if response.status_code == 200:
         return response.json()
     raise Exception(f"Spotify API Error: {response.status_code}, {response.text}")
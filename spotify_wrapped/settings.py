@@ -13,9 +13,14 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 import os
 
+from dotenv import load_dotenv
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Load environment variables once; the rest of the project reads them from settings
+load_dotenv(BASE_DIR / ".env")
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -112,6 +117,18 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+AUTHENTICATION_BACKENDS = [
+    "accounts.backends.BoundedHashingModelBackend",
+]
+
+# Password hashing pool (see accounts.hashing): worker threads (0 hashes inline),
+# how many more requests may wait before new ones get HTTP 429, and how many of
+# those slots sign-ups may hold (0 means half).
+PASSWORD_HASHING_WORKERS = int(os.getenv('PASSWORD_HASHING_WORKERS', str(os.cpu_count() or 1)))
+PASSWORD_HASHING_QUEUE_SIZE = int(os.getenv('PASSWORD_HASHING_QUEUE_SIZE', '16'))
+PASSWORD_HASHING_SIGNUP_SLOTS = int(os.getenv('PASSWORD_HASHING_SIGNUP_SLOTS', '0'))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
@@ -138,8 +155,45 @@ SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID')
 SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET')
 SPOTIFY_REDIRECT_URI = os.getenv('SPOTIFY_REDIRECT_URI')
 
+# Pooled connections to Spotify and concurrent requests per process (see accounts.spotify)
+SPOTIFY_HTTP_POOL_SIZE = int(os.getenv('SPOTIFY_HTTP_POOL_SIZE', '10'))
+
+# Seconds to wait for Spotify to connect or send data before a call fails
+SPOTIFY_HTTP_TIMEOUT = float(os.getenv('SPOTIFY_HTTP_TIMEOUT', '10'))
+
+# Wrapped history retention: how many wraps to keep per user and term (0 keeps all,
+# set a limit to opt in to pruning), and whether to skip saving a wrap identical to
+# the previous one for that term.
+WRAPPED_HISTORY_RETENTION = int(os.getenv('WRAPPED_HISTORY_RETENTION', '0'))
+WRAPPED_HISTORY_SKIP_DUPLICATES = os.getenv('WRAPPED_HISTORY_SKIP_DUPLICATES', 'True') == 'True'
+
+# Seconds a wrap response is replayed for retries carrying the same Idempotency-Key
+IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', '86400'))
+
+# Request profiling (see accounts.profiling): shared secret for the X-Profile-Token
+# header, fraction of requests profiled at random, profiles kept per process, and
+# hot functions recorded per profile.
+PROFILING_TOKEN = os.getenv('PROFILING_TOKEN', '')
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_BUFFER_SIZE = int(os.getenv('PROFILING_BUFFER_SIZE', '50'))
+PROFILING_TOP_N = int(os.getenv('PROFILING_TOP_N', '20'))
+
+# Set CACHE_BACKEND (e.g. django.core.cache.backends.redis.RedisCache) and
+# CACHE_LOCATION to share the cache between worker processes. Cached user
+# principals and Idempotency-Key replays need a shared cache across workers.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        "LOCATION": os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+# Seconds an authenticated user principal stays cached (see accounts.authentication).
+# Principals are only cached when the cache above is shared between processes.
+AUTH_PRINCIPAL_CACHE_TTL = int(os.getenv('AUTH_PRINCIPAL_CACHE_TTL', '60'))
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
     ),
 }
\ No newline at end of file